@@ -20,6 +20,8 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 THE SOFTWARE.
 """
 
+from pytools import memoize
+
 from boxtree.array_context import PyOpenCLArrayContext as PyOpenCLArrayContextBase
 from arraycontext.pytest import (
         _PytestPyOpenCLArrayContextFactoryWithClass,
@@ -61,10 +63,28 @@ def _acf():
     return PyOpenCLArrayContext(queue, force_device_scalars=True)
 
 
+@memoize
+def _get_pytest_cl_context(device):
+    import pyopencl as cl
+    return cl.Context([device])
+
+
 class PytestPyOpenCLArrayContextFactory(
         _PytestPyOpenCLArrayContextFactoryWithClass):
     actx_class = PyOpenCLArrayContext
 
+    def get_command_queue(self):
+        # NOTE: creating a context is expensive, so a single one is shared
+        # by all the tests in a session and only the queue is created anew.
+        # The pyopencl first-argument caches are keyed on the context, so
+        # they stay valid and are deliberately not cleared here.
+        from gc import collect
+        collect()
+
+        import pyopencl as cl
+        ctx = _get_pytest_cl_context(self.device)
+        return ctx, cl.CommandQueue(ctx)
+
     def __call__(self):
         # NOTE: prevent any cache explosions during testing!
         from sympy.core.cache import clear_cache
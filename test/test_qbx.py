@@ -76,8 +76,7 @@ def test_direct_qbx_vs_eigval(actx_factory, expn_class, visualize=False):
 
     for n in [200, 300, 400]:
         t = np.linspace(0, 2 * np.pi, n, endpoint=False)
-        unit_circle = np.exp(1j * t)
-        unit_circle = np.array([unit_circle.real, unit_circle.imag])
+        unit_circle = np.array([np.cos(t), np.sin(t)])
 
         sigma = np.cos(mode_nr * t)
         eigval = 1/(2*mode_nr)
@@ -86,12 +85,11 @@ def test_direct_qbx_vs_eigval(actx_factory, expn_class, visualize=False):
 
         h = 2 * np.pi / n
 
-        targets = actx.from_numpy(unit_circle)
-        sources = actx.from_numpy(unit_circle)
+        targets = sources = actx.from_numpy(unit_circle)
 
         radius = 7 * h
         centers = actx.from_numpy((1 - radius) * unit_circle)
-        expansion_radii = actx.from_numpy(radius * np.ones(n))
+        expansion_radii = actx.from_numpy(np.full(n, radius))
         strengths = (actx.from_numpy(sigma * h),)
 
         evt, (result_qbx,) = lpot(
@@ -133,10 +131,11 @@ def test_direct_qbx_vs_eigval_with_tgt_deriv(
 
     from sumpy.qbx import LayerPotential
 
-    lpot_dx = LayerPotential(actx.context, expansion=expn_class(lknl, order),
-            target_kernels=(AxisTargetDerivative(0, lknl),), source_kernels=(lknl,))
-    lpot_dy = LayerPotential(actx.context, expansion=expn_class(lknl, order),
-            target_kernels=(AxisTargetDerivative(1, lknl),), source_kernels=(lknl,))
+    lpot = LayerPotential(actx.context, expansion=expn_class(lknl, order),
+            target_kernels=(
+                AxisTargetDerivative(0, lknl),
+                AxisTargetDerivative(1, lknl)),
+            source_kernels=(lknl,))
 
     mode_nr = 15
 
@@ -144,10 +143,16 @@ def test_direct_qbx_vs_eigval_with_tgt_deriv(
 
     eocrec = EOCRecorder()
 
-    for n in [200, 300, 400]:
+    # NOTE: the convergence order is not checked for LineTaylorLocalExpansion,
+    # so only make sure that it runs on the smallest problem
+    if expn_class is LineTaylorLocalExpansion:
+        nelements = [200]
+    else:
+        nelements = [200, 300, 400]
+
+    for n in nelements:
         t = np.linspace(0, 2 * np.pi, n, endpoint=False)
-        unit_circle = np.exp(1j * t)
-        unit_circle = np.array([unit_circle.real, unit_circle.imag])
+        unit_circle = np.array([np.cos(t), np.sin(t)])
 
         sigma = np.cos(mode_nr * t)
         #eigval = 1/(2*mode_nr)
@@ -157,19 +162,14 @@ def test_direct_qbx_vs_eigval_with_tgt_deriv(
 
         h = 2 * np.pi / n
 
-        targets = actx.from_numpy(unit_circle)
-        sources = actx.from_numpy(unit_circle)
+        targets = sources = actx.from_numpy(unit_circle)
 
         radius = 7 * h
         centers = actx.from_numpy((1 - radius) * unit_circle)
-        expansion_radii = actx.from_numpy(radius * np.ones(n))
+        expansion_radii = actx.from_numpy(np.full(n, radius))
         strengths = (actx.from_numpy(sigma * h),)
 
-        evt, (result_qbx_dx,) = lpot_dx(
-                actx.queue,
-                targets, sources, centers, strengths,
-                expansion_radii=expansion_radii)
-        evt, (result_qbx_dy,) = lpot_dy(
+        evt, (result_qbx_dx, result_qbx_dy) = lpot(
                 actx.queue,
                 targets, sources, centers, strengths,
                 expansion_radii=expansion_radii)